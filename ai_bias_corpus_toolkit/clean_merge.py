@@ -1,80 +1,223 @@
 #!/usr/bin/env python3
-import argparse, os, re, sys, time
+import argparse, asyncio, os, re, sys, time
+import numpy as np
 import pandas as pd
-from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from urllib.parse import parse_qsl, urlencode, urlparse, urlsplit, urlunsplit
 from rapidfuzz import fuzz
+from rapidfuzz.distance import JaroWinkler
+from rapidfuzz.process import cdist
 from tqdm import tqdm
-import requests
+import aiohttp
+import pyarrow as pa
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the numpy fallback below is used
+    njit = None
+import pyarrow.csv as pacsv
+import pyarrow.dataset as pads
 import trafilatura
 
 SCHEMA = ["id","date_pub","type_source","titre","lien","langue","controverse","secteur","territoire",
  "acteurs","role_acteurs","rapports_pouvoir","issue","mots_cles","extrait_citation","note_analytique",
  "source_name","source_type","source_country"]
 
+# compiled once at import; applied column-wise during normalization
+_HTML_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+
+# tracking params that make the same article look like distinct URLs
+_CANON_QUERY_DROP = {"utm_source","utm_medium","utm_campaign","utm_content","utm_term","fbclid","gclid"}
+
+@lru_cache(maxsize=None)
+def _canon_url(u):
+    if not u:
+        return ""
+    p = urlsplit(u)
+    q = [(k, v) for k, v in parse_qsl(p.query) if k not in _CANON_QUERY_DROP]
+    return urlunsplit((p.scheme, p.netloc.lower(), p.path.rstrip("/"), urlencode(q), ""))
+
 def load_raw(raw_dir):
-    frames = []
-    for f in os.listdir(raw_dir):
-        if f.endswith(".csv"):
-            df = pd.read_csv(os.path.join(raw_dir, f))
-            frames.append(df)
-    if not frames:
+    # shards are Parquet since the harvesters moved off CSV; CSV shards from
+    # older runs still load through the Arrow CSV parser
+    pq = [os.path.join(raw_dir, f) for f in os.listdir(raw_dir) if f.endswith(".parquet")]
+    csvs = [os.path.join(raw_dir, f) for f in os.listdir(raw_dir) if f.endswith(".csv")]
+    tables = []
+    if pq:
+        tables.append(pads.dataset(pq, format="parquet").to_table())
+    # keep date_pub textual so CSV shards line up with the Parquet schema;
+    # normalize() re-parses it anyway
+    convert = pacsv.ConvertOptions(column_types={"date_pub": pa.string()})
+    tables += [pacsv.read_csv(f, read_options=pacsv.ReadOptions(use_threads=True),
+                              convert_options=convert)
+               for f in csvs]
+    if not tables:
         return pd.DataFrame(columns=SCHEMA)
-    return pd.concat(frames, ignore_index=True)
+    big = pa.concat_tables(tables, promote_options="permissive")
+    return big.to_pandas(types_mapper=pd.ArrowDtype)
 
 def normalize(df):
     # enforce columns
     for c in SCHEMA:
         if c not in df.columns:
             df[c] = None
-    # simple normalizations
-    df["titre"] = df["titre"].fillna("").str.strip()
+    # simple normalizations (vectorized; Arrow-backed columns want pattern strings)
+    df["titre"] = (df["titre"].fillna("")
+                   .str.replace(_HTML_RE.pattern, " ", regex=True)
+                   .str.replace(_WS_RE.pattern, " ", regex=True)
+                   .str.strip())
     df["lien"] = df["lien"].fillna("").str.strip()
-    df["date_pub"] = pd.to_datetime(df["date_pub"], errors="coerce")
-    # domain helper
-    df["domain"] = df["lien"].apply(lambda u: urlparse(u).netloc if isinstance(u, str) and u else None)
+    # sources emit ISO-like strings: take the vectorized C parser first and only
+    # fall back to the slow per-cell parser for the rows it rejects
+    dp = df["date_pub"]
+    parsed = pd.to_datetime(dp, format="ISO8601", errors="coerce", utc=True, cache=True)
+    mask = parsed.isna() & dp.notna()
+    if mask.any():
+        parsed.loc[mask] = pd.to_datetime(dp[mask], errors="coerce", utc=True, cache=True)
+    df["date_pub"] = parsed
+    # domain helper: parse each unique URL once, then broadcast back to rows
+    uniq, inv = np.unique(df["lien"].to_numpy(), return_inverse=True)
+    netlocs = np.array([urlparse(u).netloc if isinstance(u, str) and u else None for u in uniq],
+                       dtype=object)
+    df["domain"] = netlocs[inv]
+    df["lien_canon"] = [_canon_url(u) for u in df["lien"]]
     return df
 
+def _canon(s):
+    # token-set canonical form, computed once per title instead of inside every scorer call
+    return " ".join(sorted(set(re.findall(r"\w+", s.lower()))))
+
+def _expand_pairs_np(flat, offsets, n):
+    # encode each within-posting-list pair (i<j) as i*n+j
+    chunks = []
+    for t in range(len(offsets)-1):
+        p = flat[offsets[t]:offsets[t+1]]
+        if len(p) > 1:
+            a, b = np.triu_indices(len(p), 1)
+            chunks.append(p[a]*n + p[b])
+    if not chunks:
+        return np.empty(0, dtype=np.int64)
+    return np.concatenate(chunks)
+
+if njit is not None:
+    @njit(cache=True)
+    def _expand_pairs(flat, offsets, n):
+        total = 0
+        for t in range(len(offsets)-1):
+            m = offsets[t+1] - offsets[t]
+            total += m*(m-1)//2
+        keys = np.empty(total, dtype=np.int64)
+        k = 0
+        for t in range(len(offsets)-1):
+            for a in range(offsets[t], offsets[t+1]):
+                ia = flat[a]*n
+                for b in range(a+1, offsets[t+1]):
+                    keys[k] = ia + flat[b]
+                    k += 1
+        return keys
+else:
+    _expand_pairs = _expand_pairs_np
+
+def _candidate_pairs(titles, lengths):
+    # blocking for the cross-domain pass: inverted token index (top-1% most
+    # frequent tokens dropped as stopwords), keep pairs sharing >=2 tokens
+    # whose lengths differ by <30%; the pair expansion runs on typed arrays,
+    # JIT-compiled when numba is around
+    postings = {}
+    for i, t in enumerate(titles):
+        for tok in t.split():
+            postings.setdefault(tok, []).append(i)
+    if not postings:
+        return
+    sizes = np.array([len(p) for p in postings.values()], dtype=np.int64)
+    cut = np.quantile(sizes, 0.99)
+    lists = [p for p in postings.values() if len(p) <= cut]
+    n = len(titles)
+    flat = np.array([i for p in lists for i in p], dtype=np.int64)
+    offsets = np.zeros(len(lists)+1, dtype=np.int64)
+    np.cumsum([len(p) for p in lists], out=offsets[1:])
+    keys = _expand_pairs(flat, offsets, n)
+    if keys.size == 0:
+        return
+    uniq, cnt = np.unique(keys, return_counts=True)
+    uniq = uniq[cnt >= 2]
+    ii, jj = uniq // n, uniq % n
+    ok = np.abs(lengths[ii]-lengths[jj]) <= 0.3*np.maximum(lengths[ii], lengths[jj])
+    # posting lists are built in ascending row order, so i<j always holds
+    yield from zip(ii[ok].tolist(), jj[ok].tolist())
+
 def dedupe(df, thresh=90):
     df = df.sort_values("date_pub", ascending=False).reset_index(drop=True)
-    keep = []
-    seen = [False]*len(df)
-    for i in tqdm(range(len(df)), desc="Dedup"):
-        if seen[i]: continue
-        keep.append(i)
-        ti = df.at[i, "titre"]
-        di = df.at[i, "domain"]
-        for j in range(i+1, len(df)):
-            if seen[j]: continue
-            dj = df.at[j, "domain"]
-            # if same domain and titles similar, drop j
-            score = fuzz.token_set_ratio(ti, df.at[j, "titre"])
-            if (di and dj and di==dj and score>=thresh) or (score>=98):
-                seen[j] = True
-    return df.iloc[keep].copy()
-
-def extract_text(url, timeout=25):
-    try:
-        r = requests.get(url, timeout=timeout, headers={"User-Agent":"Mozilla/5.0"})
-        if r.status_code >= 400:
-            return None
-        downloaded = trafilatura.extract(r.text, url=url, include_comments=False, include_tables=False)
-        return downloaded
-    except Exception:
-        return None
+    # same-URL short circuit: exact duplicates (modulo tracking params) never
+    # reach the fuzzy pass; rows without a link are all kept
+    dup_url = df["lien_canon"].duplicated() & (df["lien_canon"] != "")
+    df = df.loc[~dup_url.to_numpy()].reset_index(drop=True)
+    n = len(df)
+    if n < 2:
+        return df.copy()
+    # materialize once as an ndarray: C-level element access and fancy
+    # indexing for the domain buckets, no pandas indexer in the loop
+    titles = np.array([_canon(t) for t in df["titre"].to_numpy(dtype=object)], dtype=object)
+    dropped = np.zeros(n, dtype=bool)
+    # same-domain pass: one similarity matrix per domain bucket (C kernel, threaded)
+    for idx in tqdm(df.groupby("domain").indices.values(), desc="Dedup (domain)"):
+        if len(idx) < 2:
+            continue
+        bucket = titles[idx]
+        # Jaro-Winkler avoids the DP matrix entirely and honors score_cutoff
+        # for early exit; scores are 0-1 so the threshold is rescaled
+        m = cdist(bucket, bucket, scorer=JaroWinkler.normalized_similarity, processor=None,
+                  score_cutoff=thresh/100, dtype=np.float32, workers=-1)
+        # rows are date-sorted desc, so the earliest-kept i wins; drop any j matched by an i<j
+        dup = (np.triu(m, 1) >= thresh/100).any(axis=0)
+        dropped[idx[dup]] = True
+    # global near-exact pass at 98, restricted to blocked candidate pairs
+    lengths = np.fromiter((len(t) for t in titles), dtype=np.int64, count=n)
+    for i, j in tqdm(_candidate_pairs(titles, lengths), desc="Dedup (global)"):
+        if dropped[j]:
+            continue
+        if fuzz.ratio(titles[i], titles[j], processor=None, score_cutoff=98) >= 98:
+            dropped[j] = True
+    return df.iloc[np.flatnonzero(~dropped)].copy()
+
+async def _fetch(session, url, sem, timeout=25):
+    async with sem:
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as r:
+            if r.status >= 400:
+                return None
+            return await r.text()
+
+async def _extract_all(urls, concurrency=32, extract_workers=8):
+    # bounded-concurrency downloads; trafilatura runs in a thread pool (CPU work)
+    sem = asyncio.Semaphore(concurrency)
+    loop = asyncio.get_running_loop()
+    conn = aiohttp.TCPConnector(limit=64, limit_per_host=4)
+    texts = [None] * len(urls)
+
+    async def one(i, url):
+        try:
+            html = await _fetch(session, url, sem)
+        except Exception:
+            return
+        if html:
+            texts[i] = await loop.run_in_executor(
+                pool, lambda: trafilatura.extract(
+                    html, url=url, include_comments=False, include_tables=False))
+
+    with ThreadPoolExecutor(extract_workers) as pool:
+        async with aiohttp.ClientSession(connector=conn,
+                                         headers={"User-Agent": "Mozilla/5.0"}) as session:
+            tasks = [asyncio.ensure_future(one(i, u)) for i, u in enumerate(urls) if u]
+            for fut in tqdm(asyncio.as_completed(tasks), total=len(tasks), desc="Extract text"):
+                await fut
+    return texts
 
 def maybe_extract(df, do_extract=False):
     if not do_extract:
         return df
-    texts = []
-    for u in tqdm(df["lien"].fillna("").tolist(), desc="Extract text"):
-        if not u:
-            texts.append(None)
-            continue
-        texts.append(extract_text(u))
-    if "fulltext" not in df.columns:
-        df["fulltext"] = texts
-    else:
-        df["fulltext"] = texts
+    urls = df["lien"].fillna("").tolist()
+    df["fulltext"] = asyncio.run(_extract_all(urls))
     return df
 
 def parse_args():
@@ -101,7 +244,12 @@ def main():
     cols = SCHEMA + ([ "fulltext"] if "fulltext" in df.columns else [])
     df = df[cols]
     os.makedirs(os.path.dirname(args.out), exist_ok=True)
-    df.to_csv(args.out, index=False)
+    # Parquet is the canonical corpus; the CSV goes through Arrow's threaded
+    # C++ writer instead of pandas' row-by-row to_csv
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pacsv.write_csv(table, args.out,
+                    write_options=pacsv.WriteOptions(include_header=True))
+    df.to_parquet(os.path.splitext(args.out)[0] + ".parquet", compression="zstd")
     print(f"Wrote {args.out} with {len(df)} rows.")
 
 if __name__ == "__main__":
@@ -1,12 +1,28 @@
 #!/usr/bin/env python3
-import argparse, os, time, sys, math, json, csv, re
+import argparse, asyncio, os, time, sys, math, json, csv, re, threading
+import aiohttp
+import orjson
 import pandas as pd
-import feedparser, requests, yaml
+import feedparser, yaml
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import timezone
+from lxml import etree
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlencode, urlparse, parse_qs, urljoin
+from urllib3.util.retry import Retry
+import requests_cache
 from dateutil import parser as dtp
 from dateparser import parse as dateparse
 from tqdm import tqdm
 
+# one pooled session for every sync fetch: keep-alive amortizes TLS handshakes,
+# the on-disk cache makes re-runs skip already-seen responses entirely
+_SESSION = requests_cache.CachedSession("data/.http_cache", expire_after=86400)
+_SESSION.headers["User-Agent"] = "Mozilla/5.0"
+_SESSION.mount("https://", HTTPAdapter(pool_connections=64, pool_maxsize=64,
+                                       max_retries=Retry(total=3, backoff_factor=0.3)))
+
 def ensure_dir(d):
     os.makedirs(d, exist_ok=True)
 
@@ -18,6 +34,10 @@ def clamp_date(dt, since, until):
 def iso_or_none(dt):
     return dt.isoformat() if dt else None
 
+# compiled once at import; these run on every title/summary of every entry
+_HTML_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+
 def clean_text(s):
     # Normalize input to string and strip HTML/whitespace. Handles bytes, dicts, and objects.
     if s is None:
@@ -41,50 +61,106 @@ def clean_text(s):
         if isinstance(extracted, bytes):
             extracted = extracted.decode('utf-8', errors='ignore')
         s = extracted if isinstance(extracted, str) else str(s)
-    return re.sub(r'\s+', ' ', re.sub(r'<[^>]+>', ' ', s)).strip()
-
-def harvest_rss(urls, since, until, rate, outdir, label="rss"):
-    rows = []
-    for url in tqdm(urls, desc=f"RSS ({label})"):
-        feed = feedparser.parse(url)
-        for e in feed.entries:
-            # pick best date
-            dt = None
-            for k in ["published_parsed","updated_parsed"]:
-                if getattr(e, k, None):
-                    try:
-                        dt = dtp.parse(time.strftime('%Y-%m-%dT%H:%M:%S', getattr(e, k)))
-                        break
-                    except Exception:
-                        pass
-            if not dt and getattr(e, "published", None):
-                dt = dateparse(e.published)
-            if not dt and getattr(e, "updated", None):
-                dt = dateparse(e.updated)
-            if dt:
-                dt = clamp_date(dt, since, until)
-                if not dt: 
-                    continue
-            link = getattr(e, "link", None)
-            title = clean_text(getattr(e, "title", None))
-            summary = clean_text(getattr(e, "summary", None))
-            rows.append({
-                "date_pub": iso_or_none(dt),
-                "type_source": "Presse",
-                "titre": title,
-                "lien": link,
-                "langue": None,
-                "mots_cles": None,
-                "extrait_citation": summary,
-                "source_name": clean_text(getattr(e, "source", None)) or clean_text(getattr(e, "author", None)),
-                "source_type": "rss",
-                "source_country": None
-            })
+    return _WS_RE.sub(' ', _HTML_RE.sub(' ', s)).strip()
+
+# per-netloc politeness: feeds on the same host are serialized and rate-limited,
+# unrelated hosts fetch in parallel
+_HOST_LOCKS = defaultdict(threading.Semaphore)
+
+_ATOM_NS = {"atom": "http://www.w3.org/2005/Atom"}
+
+# raw-shard columns; harvesters accumulate parallel lists so the DataFrame is
+# built once, columnar, instead of from a list of per-row dicts
+_RAW_COLS = ("date_pub","type_source","titre","lien","langue","mots_cles",
+             "extrait_citation","source_name","source_type","source_country")
+
+def _fast_parse_rss(xml_bytes):
+    # minimal RSS/Atom item extraction: trades feedparser's sanitizing pipeline
+    # for a direct libxml2 parse; only the fields the harvester uses
+    root = etree.fromstring(xml_bytes, parser=etree.XMLParser(recover=True, resolve_entities=False))
+    if root is None:
+        return []
+    entries = []
+    for it in root.xpath("//item"):
+        entries.append({
+            "title": it.findtext("title"),
+            "link": it.findtext("link"),
+            "summary": it.findtext("description"),
+            "published": it.findtext("pubDate"),
+            "author": it.findtext("author"),
+        })
+    for it in root.xpath("//atom:entry", namespaces=_ATOM_NS):
+        link_el = it.find("atom:link", _ATOM_NS)
+        entries.append({
+            "title": it.findtext("atom:title", namespaces=_ATOM_NS),
+            "link": link_el.get("href") if link_el is not None else None,
+            "summary": it.findtext("atom:summary", namespaces=_ATOM_NS)
+                       or it.findtext("atom:content", namespaces=_ATOM_NS),
+            "published": it.findtext("atom:published", namespaces=_ATOM_NS)
+                         or it.findtext("atom:updated", namespaces=_ATOM_NS),
+            "author": it.findtext("atom:author/atom:name", namespaces=_ATOM_NS),
+        })
+    return entries
+
+def _polite_parse(url, rate):
+    with _HOST_LOCKS[urlparse(url).netloc]:
+        try:
+            content = _SESSION.get(url, timeout=30).content
+        except Exception:
+            content = None
         time.sleep(rate)
-    if rows:
-        df = pd.DataFrame(rows)
-        df.to_csv(os.path.join(outdir, f"rss_{int(time.time())}.csv"), index=False)
-    return len(rows)
+    if content:
+        try:
+            entries = _fast_parse_rss(content)
+        except etree.XMLSyntaxError:
+            entries = []
+        if entries:
+            return entries
+        # fall back to feedparser for feeds the fast path cannot handle
+        return feedparser.parse(content).entries
+    return feedparser.parse(url).entries
+
+def harvest_rss(urls, since, until, rate, outdir, label="rss", workers=8):
+    cols = {k: [] for k in _RAW_COLS}
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        futures = {ex.submit(_polite_parse, url, rate): url for url in urls}
+        for fut in tqdm(as_completed(futures), total=len(futures), desc=f"RSS ({label})"):
+            for e in fut.result():
+                # pick best date
+                dt = None
+                for k in ["published_parsed","updated_parsed"]:
+                    if e.get(k):
+                        try:
+                            dt = dtp.parse(time.strftime('%Y-%m-%dT%H:%M:%S', e[k]))
+                            break
+                        except Exception:
+                            pass
+                if not dt and e.get("published"):
+                    dt = dateparse(e["published"])
+                if not dt and e.get("updated"):
+                    dt = dateparse(e["updated"])
+                if dt and dt.tzinfo:
+                    # RFC822 pubDates carry an offset; clamp bounds are naive
+                    dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+                if dt:
+                    dt = clamp_date(dt, since, until)
+                    if not dt:
+                        continue
+                cols["date_pub"].append(iso_or_none(dt))
+                cols["type_source"].append("Presse")
+                cols["titre"].append(clean_text(e.get("title")))
+                cols["lien"].append(e.get("link"))
+                cols["langue"].append(None)
+                cols["mots_cles"].append(None)
+                cols["extrait_citation"].append(clean_text(e.get("summary")))
+                cols["source_name"].append(clean_text(e.get("source")) or clean_text(e.get("author")))
+                cols["source_type"].append("rss")
+                cols["source_country"].append(None)
+    n = len(cols["titre"])
+    if n:
+        df = pd.DataFrame(cols)
+        df.to_parquet(os.path.join(outdir, f"rss_{int(time.time())}.parquet"), compression="snappy")
+    return n
 
 def harvest_openalex(conf, since, until, rate, outdir):
     base = "https://api.openalex.org/works"
@@ -93,105 +169,105 @@ def harvest_openalex(conf, since, until, rate, outdir):
         "from_publication_date": since.date().isoformat(),
         "to_publication_date": until.date().isoformat(),
         "per_page": conf.get("per_page", 200),
-        "mailto": conf.get("mailto","")
+        "mailto": conf.get("mailto",""),
+        # cursor pagination: page= walking is capped at 10k results by OpenAlex
+        "cursor": "*"
     }
-    page = 1
-    rows = []
+    cols = {k: [] for k in _RAW_COLS}
     with tqdm(desc="OpenAlex", unit="page") as pbar:
         while True:
-            params["page"] = page
             try:
-                r = requests.get(base, params=params, timeout=30)
+                r = _SESSION.get(base, params=params, timeout=30)
                 r.raise_for_status()
-                js = r.json()
+                js = orjson.loads(r.content)
             except Exception as e:
                 print("OpenAlex error:", e, file=sys.stderr)
                 break
             results = js.get("results", [])
             for w in results:
-                title = w.get("title")
                 link = w.get("doi") or (w.get("primary_location") or {}).get("source",{}).get("homepage_url")
-                date_pub = w.get("publication_date") or (w.get("from_indexed_date") or "").split("T")[0]
-                lang = w.get("language")
-                rows.append({
-                    "date_pub": date_pub,
-                    "type_source": "Académique",
-                    "titre": title,
-                    "lien": link or (w.get("id")),
-                    "langue": lang,
-                    "mots_cles": ",".join([c.get("display_name") for c in w.get("concepts",[])[:10]]),
-                    "extrait_citation": None,
-                    "source_name": (w.get("primary_location") or {}).get("source",{}).get("display_name"),
-                    "source_type": "openalex",
-                    "source_country": None
-                })
+                cols["date_pub"].append(w.get("publication_date") or (w.get("from_indexed_date") or "").split("T")[0])
+                cols["type_source"].append("Académique")
+                cols["titre"].append(w.get("title"))
+                cols["lien"].append(link or (w.get("id")))
+                cols["langue"].append(w.get("language"))
+                cols["mots_cles"].append(",".join([c.get("display_name") for c in w.get("concepts",[])[:10]]))
+                cols["extrait_citation"].append(None)
+                cols["source_name"].append((w.get("primary_location") or {}).get("source",{}).get("display_name"))
+                cols["source_type"].append("openalex")
+                cols["source_country"].append(None)
             pbar.update(1)
-            if "next_cursor" in js or js.get("meta",{}).get("count",0) > page*params["per_page"]:
-                # OpenAlex paginates by page until empty
-                if not results: break
-                page += 1
-                time.sleep(rate)
-            else:
+            cursor = js.get("meta",{}).get("next_cursor")
+            if not cursor or not results:
                 break
-    if rows:
-        df = pd.DataFrame(rows)
-        df.to_csv(os.path.join(outdir, f"openalex_{int(time.time())}.csv"), index=False)
-    return len(rows)
+            params["cursor"] = cursor
+            time.sleep(rate)
+    n = len(cols["titre"])
+    if n:
+        df = pd.DataFrame(cols)
+        df.to_parquet(os.path.join(outdir, f"openalex_{int(time.time())}.parquet"), compression="snappy")
+    return n
+
+_GDELT_URL = "https://api.gdeltproject.org/api/v2/doc/doc"
+
+async def _gdelt_fetch_months(months, q, max_records, rate, concurrency=4):
+    # each month window is an independent GET; overlap the round trips with a
+    # small semaphore (GDELT tolerates modest parallelism) and keep the polite
+    # sleep per request
+    sem = asyncio.Semaphore(concurrency)
+    articles = []
+    async with aiohttp.ClientSession() as session:
+        async def one(mstart, mend):
+            params = {
+                "query": q,
+                "mode": "ArtList",
+                "format": "json",
+                "maxrecords": max_records,
+                "startdatetime": mstart.strftime("%Y%m%d000000"),
+                "enddatetime": mend.strftime("%Y%m%d235959")
+            }
+            async with sem:
+                try:
+                    async with session.get(_GDELT_URL, params=params,
+                                           timeout=aiohttp.ClientTimeout(total=30)) as r:
+                        r.raise_for_status()
+                        js = orjson.loads(await r.read())
+                except Exception as e:
+                    print("GDELT error:", e, file=sys.stderr)
+                    js = {}
+                await asyncio.sleep(rate)
+            return js.get("articles", [])
+        tasks = [asyncio.ensure_future(one(ms, me)) for ms, me in months]
+        for fut in tqdm(asyncio.as_completed(tasks), total=len(tasks), desc="GDELT months"):
+            articles.extend(await fut)
+    return articles
 
 def harvest_gdelt(conf, since, until, rate, outdir):
     # Use GDELT Article Search API 2.0 (doc api.gdeltproject.org)
     # Query across date range by splitting into months to avoid large responses.
     q = conf.get("gkg_search","")
     max_records = conf.get("max_records", 5000)
-    rows = []
-    # monthly windows
-    start = since.date().replace(day=1)
-    end = until.date()
-    import datetime as dt
-    def month_iter(d1, d2):
-        d = d1
-        while d <= d2:
-            yield d
-            if d.month == 12:
-                d = d.replace(year=d.year+1, month=1, day=1)
-            else:
-                d = d.replace(month=d.month+1, day=1)
-    for mstart in tqdm(list(month_iter(start, end)), desc="GDELT months"):
-        mend = (mstart.replace(day=28) + pd.Timedelta(days=4)).replace(day=1) - pd.Timedelta(days=1)
-        if mend > end: mend = end
-        params = {
-            "query": q,
-            "mode": "ArtList",
-            "format": "json",
-            "maxrecords": max_records,
-            "startdatetime": mstart.strftime("%Y%m%d%H%M%S"),
-            "enddatetime": mend.strftime("%Y%m%d%H%M%S")
-        }
-        try:
-            r = requests.get("https://api.gdeltproject.org/api/v2/doc/doc", params=params, timeout=30)
-            r.raise_for_status()
-            js = r.json()
-        except Exception as e:
-            print("GDELT error:", e, file=sys.stderr)
-            continue
-        for a in js.get("articles", []):
-            rows.append({
-                "date_pub": a.get("seendate","")[:10],
-                "type_source": "Presse",
-                "titre": a.get("title"),
-                "lien": a.get("url"),
-                "langue": a.get("language"),
-                "mots_cles": None,
-                "extrait_citation": None,
-                "source_name": a.get("sourcecountry"),
-                "source_type": "gdelt",
-                "source_country": a.get("sourcecountry")
-            })
-        time.sleep(rate)
-    if rows:
-        df = pd.DataFrame(rows)
-        df.to_csv(os.path.join(outdir, f"gdelt_{int(time.time())}.csv"), index=False)
-    return len(rows)
+    cols = {k: [] for k in _RAW_COLS}
+    # monthly windows, vectorized instead of a Python date-arithmetic loop
+    month_starts = pd.date_range(since.date().replace(day=1), until.date(), freq="MS")
+    month_ends = pd.Series(month_starts + pd.offsets.MonthEnd(0)).clip(upper=pd.Timestamp(until.date()))
+    months = list(zip(month_starts, month_ends))
+    for a in asyncio.run(_gdelt_fetch_months(months, q, max_records, rate)):
+        cols["date_pub"].append(a.get("seendate","")[:10])
+        cols["type_source"].append("Presse")
+        cols["titre"].append(a.get("title"))
+        cols["lien"].append(a.get("url"))
+        cols["langue"].append(a.get("language"))
+        cols["mots_cles"].append(None)
+        cols["extrait_citation"].append(None)
+        cols["source_name"].append(a.get("sourcecountry"))
+        cols["source_type"].append("gdelt")
+        cols["source_country"].append(a.get("sourcecountry"))
+    n = len(cols["titre"])
+    if n:
+        df = pd.DataFrame(cols)
+        df.to_parquet(os.path.join(outdir, f"gdelt_{int(time.time())}.parquet"), compression="snappy")
+    return n
 
 def parse_args():
     # Conserved for compatibility but not used anymore; values are set directly in main()
@@ -215,10 +291,11 @@ def main():
     since = dtp.parse(since_str)
     until = dtp.parse(until_str)
     rate = conf.get("rate_limit",{}).get("sleep_seconds", 1.0)
+    rss_workers = conf.get("rss_workers", 8)
     # RSS (generic + NGO)
     total = 0
-    total += harvest_rss(conf["sources"].get("rss",[]), since, until, rate, out_dir, label="news")
-    total += harvest_rss(conf["sources"].get("ngo_rss",[]), since, until, rate, out_dir, label="ngo")
+    total += harvest_rss(conf["sources"].get("rss",[]), since, until, rate, out_dir, label="news", workers=rss_workers)
+    total += harvest_rss(conf["sources"].get("ngo_rss",[]), since, until, rate, out_dir, label="ngo", workers=rss_workers)
     # OpenAlex
     total += harvest_openalex(conf["sources"].get("openalex",{}), since, until, rate, out_dir)
     # GDELT
@@ -1,13 +1,33 @@
 #!/usr/bin/env python3
-import os, sys, time, re, requests
+import asyncio, os, sys, time, re, threading
+import aiohttp
+import orjson
+import numpy as np
+try:
+    from numba import njit
+except ImportError:  # numba est optionnel ; repli numpy ci-dessous
+    njit = None
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.dataset as pads
 import pandas as pd
 import feedparser
 import yaml
-from urllib.parse import urlparse
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import timezone
+from functools import lru_cache
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib.parse import parse_qsl, urlencode, urlparse, urlsplit, urlunsplit
+from urllib3.util.retry import Retry
+import requests_cache
 from dateutil import parser as dtp
 from dateparser import parse as dateparse
 from tqdm import tqdm
 from rapidfuzz import fuzz
+from rapidfuzz.distance import JaroWinkler
+from rapidfuzz.process import cdist
 import trafilatura
 
 
@@ -20,6 +40,14 @@ CLEAN_OUT_PATH = "data/clean/corpus.csv"
 EXTRACT_TEXT = True  # False pour désactiver l'extraction de texte
 
 
+# Une session partagée pour tous les fetchs synchrones : le keep-alive amortit
+# les handshakes TLS, le cache disque court-circuite les réponses déjà vues
+_SESSION = requests_cache.CachedSession("data/.http_cache", expire_after=86400)
+_SESSION.headers["User-Agent"] = "Mozilla/5.0"
+_SESSION.mount("https://", HTTPAdapter(pool_connections=64, pool_maxsize=64,
+                                       max_retries=Retry(total=3, backoff_factor=0.3)))
+
+
 # Utilitaires communs
 def ensure_dir(d):
     os.makedirs(d, exist_ok=True)
@@ -32,6 +60,21 @@ def clamp_date(dt, since, until):
 def iso_or_none(dt):
     return dt.isoformat() if dt else None
 
+# compilés une fois à l'import ; appliqués à chaque titre/résumé de chaque entrée
+_HTML_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+
+# paramètres de tracking qui font passer un même article pour des URL distinctes
+_CANON_QUERY_DROP = {"utm_source","utm_medium","utm_campaign","utm_content","utm_term","fbclid","gclid"}
+
+@lru_cache(maxsize=None)
+def _canon_url(u):
+    if not u:
+        return ""
+    p = urlsplit(u)
+    q = [(k, v) for k, v in parse_qsl(p.query) if k not in _CANON_QUERY_DROP]
+    return urlunsplit((p.scheme, p.netloc.lower(), p.path.rstrip("/"), urlencode(q), ""))
+
 def clean_text(s):
     # Normalise en chaîne et retire HTML/espaces; gère None/bytes/dicts/objets
     if s is None:
@@ -53,51 +96,107 @@ def clean_text(s):
         if isinstance(extracted, bytes):
             extracted = extracted.decode('utf-8', errors='ignore')
         s = extracted if isinstance(extracted, str) else str(s)
-    return re.sub(r'\s+', ' ', re.sub(r'<[^>]+>', ' ', s)).strip()
+    return _WS_RE.sub(' ', _HTML_RE.sub(' ', s)).strip()
 
 
 # Récolte (harvest)
-def harvest_rss(urls, since, until, rate, outdir, label="rss"):
-    rows = []
-    for url in tqdm(urls, desc=f"RSS ({label})"):
-        feed = feedparser.parse(url)
-        for e in feed.entries:
-            dt = None
-            for k in ["published_parsed","updated_parsed"]:
-                if getattr(e, k, None):
-                    try:
-                        dt = dtp.parse(time.strftime('%Y-%m-%dT%H:%M:%S', getattr(e, k)))
-                        break
-                    except Exception:
-                        pass
-            if not dt and getattr(e, "published", None):
-                dt = dateparse(e.published)
-            if not dt and getattr(e, "updated", None):
-                dt = dateparse(e.updated)
-            if dt:
-                dt = clamp_date(dt, since, until)
-                if not dt:
-                    continue
-            link = getattr(e, "link", None)
-            title = clean_text(getattr(e, "title", None))
-            summary = clean_text(getattr(e, "summary", None))
-            rows.append({
-                "date_pub": iso_or_none(dt),
-                "type_source": "Presse",
-                "titre": title,
-                "lien": link,
-                "langue": None,
-                "mots_cles": None,
-                "extrait_citation": summary,
-                "source_name": clean_text(getattr(e, "source", None)) or clean_text(getattr(e, "author", None)),
-                "source_type": "rss",
-                "source_country": None
-            })
+# Politesse par netloc : les flux d'un même hôte sont sérialisés et espacés,
+# les hôtes distincts se téléchargent en parallèle
+_HOST_LOCKS = defaultdict(threading.Semaphore)
+
+_ATOM_NS = {"atom": "http://www.w3.org/2005/Atom"}
+
+# colonnes des shards bruts ; les récolteurs accumulent des listes parallèles
+# pour construire le DataFrame une fois, en colonnes, plutôt que par dicts-lignes
+_RAW_COLS = ("date_pub","type_source","titre","lien","langue","mots_cles",
+             "extrait_citation","source_name","source_type","source_country")
+
+def _fast_parse_rss(xml_bytes):
+    # extraction minimale RSS/Atom : on troque le pipeline de sanitisation de
+    # feedparser contre un parse libxml2 direct ; seulement les champs utilisés
+    root = etree.fromstring(xml_bytes, parser=etree.XMLParser(recover=True, resolve_entities=False))
+    if root is None:
+        return []
+    entries = []
+    for it in root.xpath("//item"):
+        entries.append({
+            "title": it.findtext("title"),
+            "link": it.findtext("link"),
+            "summary": it.findtext("description"),
+            "published": it.findtext("pubDate"),
+            "author": it.findtext("author"),
+        })
+    for it in root.xpath("//atom:entry", namespaces=_ATOM_NS):
+        link_el = it.find("atom:link", _ATOM_NS)
+        entries.append({
+            "title": it.findtext("atom:title", namespaces=_ATOM_NS),
+            "link": link_el.get("href") if link_el is not None else None,
+            "summary": it.findtext("atom:summary", namespaces=_ATOM_NS)
+                       or it.findtext("atom:content", namespaces=_ATOM_NS),
+            "published": it.findtext("atom:published", namespaces=_ATOM_NS)
+                         or it.findtext("atom:updated", namespaces=_ATOM_NS),
+            "author": it.findtext("atom:author/atom:name", namespaces=_ATOM_NS),
+        })
+    return entries
+
+def _polite_parse(url, rate):
+    with _HOST_LOCKS[urlparse(url).netloc]:
+        try:
+            content = _SESSION.get(url, timeout=30).content
+        except Exception:
+            content = None
         time.sleep(rate)
-    if rows:
-        df = pd.DataFrame(rows)
-        df.to_csv(os.path.join(outdir, f"rss_{int(time.time())}.csv"), index=False)
-    return len(rows)
+    if content:
+        try:
+            entries = _fast_parse_rss(content)
+        except etree.XMLSyntaxError:
+            entries = []
+        if entries:
+            return entries
+        # repli sur feedparser pour les flux que le chemin rapide ne gère pas
+        return feedparser.parse(content).entries
+    return feedparser.parse(url).entries
+
+def harvest_rss(urls, since, until, rate, outdir, label="rss", workers=8):
+    cols = {k: [] for k in _RAW_COLS}
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        futures = {ex.submit(_polite_parse, url, rate): url for url in urls}
+        for fut in tqdm(as_completed(futures), total=len(futures), desc=f"RSS ({label})"):
+            for e in fut.result():
+                dt = None
+                for k in ["published_parsed","updated_parsed"]:
+                    if e.get(k):
+                        try:
+                            dt = dtp.parse(time.strftime('%Y-%m-%dT%H:%M:%S', e[k]))
+                            break
+                        except Exception:
+                            pass
+                if not dt and e.get("published"):
+                    dt = dateparse(e["published"])
+                if not dt and e.get("updated"):
+                    dt = dateparse(e["updated"])
+                if dt and dt.tzinfo:
+                    # les pubDate RFC822 portent un offset ; les bornes sont naïves
+                    dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+                if dt:
+                    dt = clamp_date(dt, since, until)
+                    if not dt:
+                        continue
+                cols["date_pub"].append(iso_or_none(dt))
+                cols["type_source"].append("Presse")
+                cols["titre"].append(clean_text(e.get("title")))
+                cols["lien"].append(e.get("link"))
+                cols["langue"].append(None)
+                cols["mots_cles"].append(None)
+                cols["extrait_citation"].append(clean_text(e.get("summary")))
+                cols["source_name"].append(clean_text(e.get("source")) or clean_text(e.get("author")))
+                cols["source_type"].append("rss")
+                cols["source_country"].append(None)
+    n = len(cols["titre"])
+    if n:
+        df = pd.DataFrame(cols)
+        df.to_parquet(os.path.join(outdir, f"rss_{int(time.time())}.parquet"), compression="snappy")
+    return n
 
 def harvest_openalex(conf, since, until, rate, outdir):
     base = "https://api.openalex.org/works"
@@ -106,101 +205,103 @@ def harvest_openalex(conf, since, until, rate, outdir):
         "from_publication_date": since.date().isoformat(),
         "to_publication_date": until.date().isoformat(),
         "per_page": conf.get("per_page", 200),
-        "mailto": conf.get("mailto","")
+        "mailto": conf.get("mailto",""),
+        # pagination par curseur : page= est plafonné à 10k résultats côté OpenAlex
+        "cursor": "*"
     }
-    page = 1
-    rows = []
+    cols = {k: [] for k in _RAW_COLS}
     with tqdm(desc="OpenAlex", unit="page") as pbar:
         while True:
-            params["page"] = page
             try:
-                r = requests.get(base, params=params, timeout=30)
+                r = _SESSION.get(base, params=params, timeout=30)
                 r.raise_for_status()
-                js = r.json()
+                js = orjson.loads(r.content)
             except Exception as e:
                 print("OpenAlex error:", e, file=sys.stderr)
                 break
             results = js.get("results", [])
             for w in results:
-                title = w.get("title")
                 link = w.get("doi") or (w.get("primary_location") or {}).get("source",{}).get("homepage_url")
-                date_pub = w.get("publication_date") or (w.get("from_indexed_date") or "").split("T")[0]
-                lang = w.get("language")
-                rows.append({
-                    "date_pub": date_pub,
-                    "type_source": "Académique",
-                    "titre": title,
-                    "lien": link or (w.get("id")),
-                    "langue": lang,
-                    "mots_cles": ",".join([c.get("display_name") for c in w.get("concepts",[])[:10]]),
-                    "extrait_citation": None,
-                    "source_name": (w.get("primary_location") or {}).get("source",{}).get("display_name"),
-                    "source_type": "openalex",
-                    "source_country": None
-                })
+                cols["date_pub"].append(w.get("publication_date") or (w.get("from_indexed_date") or "").split("T")[0])
+                cols["type_source"].append("Académique")
+                cols["titre"].append(w.get("title"))
+                cols["lien"].append(link or (w.get("id")))
+                cols["langue"].append(w.get("language"))
+                cols["mots_cles"].append(",".join([c.get("display_name") for c in w.get("concepts",[])[:10]]))
+                cols["extrait_citation"].append(None)
+                cols["source_name"].append((w.get("primary_location") or {}).get("source",{}).get("display_name"))
+                cols["source_type"].append("openalex")
+                cols["source_country"].append(None)
             pbar.update(1)
-            if "next_cursor" in js or js.get("meta",{}).get("count",0) > page*params["per_page"]:
-                if not results: break
-                page += 1
-                time.sleep(rate)
-            else:
+            cursor = js.get("meta",{}).get("next_cursor")
+            if not cursor or not results:
                 break
-    if rows:
-        df = pd.DataFrame(rows)
-        df.to_csv(os.path.join(outdir, f"openalex_{int(time.time())}.csv"), index=False)
-    return len(rows)
+            params["cursor"] = cursor
+            time.sleep(rate)
+    n = len(cols["titre"])
+    if n:
+        df = pd.DataFrame(cols)
+        df.to_parquet(os.path.join(outdir, f"openalex_{int(time.time())}.parquet"), compression="snappy")
+    return n
+
+_GDELT_URL = "https://api.gdeltproject.org/api/v2/doc/doc"
+
+async def _gdelt_fetch_months(months, q, max_records, rate, concurrency=4):
+    # chaque fenêtre mensuelle est un GET indépendant ; on recouvre les allers-
+    # retours avec un petit sémaphore (GDELT tolère un parallélisme modeste)
+    # en gardant la pause de politesse par requête
+    sem = asyncio.Semaphore(concurrency)
+    articles = []
+    async with aiohttp.ClientSession() as session:
+        async def one(mstart, mend):
+            params = {
+                "query": q,
+                "mode": "ArtList",
+                "format": "json",
+                "maxrecords": max_records,
+                "startdatetime": mstart.strftime("%Y%m%d000000"),
+                "enddatetime": mend.strftime("%Y%m%d235959")
+            }
+            async with sem:
+                try:
+                    async with session.get(_GDELT_URL, params=params,
+                                           timeout=aiohttp.ClientTimeout(total=30)) as r:
+                        r.raise_for_status()
+                        js = orjson.loads(await r.read())
+                except Exception as e:
+                    print("GDELT error:", e, file=sys.stderr)
+                    js = {}
+                await asyncio.sleep(rate)
+            return js.get("articles", [])
+        tasks = [asyncio.ensure_future(one(ms, me)) for ms, me in months]
+        for fut in tqdm(asyncio.as_completed(tasks), total=len(tasks), desc="GDELT months"):
+            articles.extend(await fut)
+    return articles
 
 def harvest_gdelt(conf, since, until, rate, outdir):
     q = conf.get("gkg_search","")
     max_records = conf.get("max_records", 5000)
-    rows = []
-    start = since.date().replace(day=1)
-    end = until.date()
-    import datetime as dt
-    def month_iter(d1, d2):
-        d = d1
-        while d <= d2:
-            yield d
-            if d.month == 12:
-                d = d.replace(year=d.year+1, month=1, day=1)
-            else:
-                d = d.replace(month=d.month+1, day=1)
-    for mstart in tqdm(list(month_iter(start, end)), desc="GDELT months"):
-        mend = (mstart.replace(day=28) + pd.Timedelta(days=4)).replace(day=1) - pd.Timedelta(days=1)
-        if mend > end: mend = end
-        params = {
-            "query": q,
-            "mode": "ArtList",
-            "format": "json",
-            "maxrecords": max_records,
-            "startdatetime": mstart.strftime("%Y%m%d%H%M%S"),
-            "enddatetime": mend.strftime("%Y%m%d%H%M%S")
-        }
-        try:
-            r = requests.get("https://api.gdeltproject.org/api/v2/doc/doc", params=params, timeout=30)
-            r.raise_for_status()
-            js = r.json()
-        except Exception as e:
-            print("GDELT error:", e, file=sys.stderr)
-            continue
-        for a in js.get("articles", []):
-            rows.append({
-                "date_pub": a.get("seendate","")[:10],
-                "type_source": "Presse",
-                "titre": a.get("title"),
-                "lien": a.get("url"),
-                "langue": a.get("language"),
-                "mots_cles": None,
-                "extrait_citation": None,
-                "source_name": a.get("sourcecountry"),
-                "source_type": "gdelt",
-                "source_country": a.get("sourcecountry")
-            })
-        time.sleep(rate)
-    if rows:
-        df = pd.DataFrame(rows)
-        df.to_csv(os.path.join(outdir, f"gdelt_{int(time.time())}.csv"), index=False)
-    return len(rows)
+    cols = {k: [] for k in _RAW_COLS}
+    # fenêtres mensuelles vectorisées plutôt qu'une boucle d'arithmétique de dates
+    month_starts = pd.date_range(since.date().replace(day=1), until.date(), freq="MS")
+    month_ends = pd.Series(month_starts + pd.offsets.MonthEnd(0)).clip(upper=pd.Timestamp(until.date()))
+    months = list(zip(month_starts, month_ends))
+    for a in asyncio.run(_gdelt_fetch_months(months, q, max_records, rate)):
+        cols["date_pub"].append(a.get("seendate","")[:10])
+        cols["type_source"].append("Presse")
+        cols["titre"].append(a.get("title"))
+        cols["lien"].append(a.get("url"))
+        cols["langue"].append(a.get("language"))
+        cols["mots_cles"].append(None)
+        cols["extrait_citation"].append(None)
+        cols["source_name"].append(a.get("sourcecountry"))
+        cols["source_type"].append("gdelt")
+        cols["source_country"].append(a.get("sourcecountry"))
+    n = len(cols["titre"])
+    if n:
+        df = pd.DataFrame(cols)
+        df.to_parquet(os.path.join(outdir, f"gdelt_{int(time.time())}.parquet"), compression="snappy")
+    return n
 
 
 # Nettoyage / Fusion
@@ -211,65 +312,184 @@ SCHEMA = [
 ]
 
 def load_raw(raw_dir):
-    frames = []
-    for f in os.listdir(raw_dir):
-        if f.endswith(".csv"):
-            df = pd.read_csv(os.path.join(raw_dir, f))
-            frames.append(df)
-    if not frames:
+    # les shards sont en Parquet depuis que la récolte a quitté le CSV ; les
+    # shards CSV d'anciennes exécutions passent encore par le parseur Arrow
+    pq = [os.path.join(raw_dir, f) for f in os.listdir(raw_dir) if f.endswith(".parquet")]
+    csvs = [os.path.join(raw_dir, f) for f in os.listdir(raw_dir) if f.endswith(".csv")]
+    tables = []
+    if pq:
+        tables.append(pads.dataset(pq, format="parquet").to_table())
+    # date_pub reste textuel pour s'aligner sur le schéma Parquet ;
+    # normalize() le re-parse de toute façon
+    convert = pacsv.ConvertOptions(column_types={"date_pub": pa.string()})
+    tables += [pacsv.read_csv(f, read_options=pacsv.ReadOptions(use_threads=True),
+                              convert_options=convert)
+               for f in csvs]
+    if not tables:
         return pd.DataFrame(columns=SCHEMA)
-    return pd.concat(frames, ignore_index=True)
+    big = pa.concat_tables(tables, promote_options="permissive")
+    return big.to_pandas(types_mapper=pd.ArrowDtype)
 
 def normalize(df):
     for c in SCHEMA:
         if c not in df.columns:
             df[c] = None
-    df["titre"] = df["titre"].fillna("").str.strip()
+    # normalisations vectorisées ; les colonnes Arrow attendent des motifs chaîne
+    df["titre"] = (df["titre"].fillna("")
+                   .str.replace(_HTML_RE.pattern, " ", regex=True)
+                   .str.replace(_WS_RE.pattern, " ", regex=True)
+                   .str.strip())
     df["lien"] = df["lien"].fillna("").str.strip()
-    df["date_pub"] = pd.to_datetime(df["date_pub"], errors="coerce")
-    df["domain"] = df["lien"].apply(lambda u: urlparse(u).netloc if isinstance(u, str) and u else None)
+    # les sources émettent de l'ISO : parseur C vectorisé d'abord, repli
+    # cellule par cellule seulement pour les lignes qu'il rejette
+    dp = df["date_pub"]
+    parsed = pd.to_datetime(dp, format="ISO8601", errors="coerce", utc=True, cache=True)
+    mask = parsed.isna() & dp.notna()
+    if mask.any():
+        parsed.loc[mask] = pd.to_datetime(dp[mask], errors="coerce", utc=True, cache=True)
+    df["date_pub"] = parsed
+    # colonne domaine : on ne parse chaque URL unique qu'une fois avant de rediffuser
+    uniq, inv = np.unique(df["lien"].to_numpy(), return_inverse=True)
+    netlocs = np.array([urlparse(u).netloc if isinstance(u, str) and u else None for u in uniq],
+                       dtype=object)
+    df["domain"] = netlocs[inv]
+    df["lien_canon"] = [_canon_url(u) for u in df["lien"]]
     return df
 
+def _canon(s):
+    # forme canonique "token set", calculée une seule fois par titre plutôt qu'à chaque score
+    return " ".join(sorted(set(re.findall(r"\w+", s.lower()))))
+
+def _expand_pairs_np(flat, offsets, n):
+    # encode chaque paire (i<j) d'une posting list en i*n+j
+    chunks = []
+    for t in range(len(offsets)-1):
+        p = flat[offsets[t]:offsets[t+1]]
+        if len(p) > 1:
+            a, b = np.triu_indices(len(p), 1)
+            chunks.append(p[a]*n + p[b])
+    if not chunks:
+        return np.empty(0, dtype=np.int64)
+    return np.concatenate(chunks)
+
+if njit is not None:
+    @njit(cache=True)
+    def _expand_pairs(flat, offsets, n):
+        total = 0
+        for t in range(len(offsets)-1):
+            m = offsets[t+1] - offsets[t]
+            total += m*(m-1)//2
+        keys = np.empty(total, dtype=np.int64)
+        k = 0
+        for t in range(len(offsets)-1):
+            for a in range(offsets[t], offsets[t+1]):
+                ia = flat[a]*n
+                for b in range(a+1, offsets[t+1]):
+                    keys[k] = ia + flat[b]
+                    k += 1
+        return keys
+else:
+    _expand_pairs = _expand_pairs_np
+
+def _candidate_pairs(titles, lengths):
+    # blocage pour la passe inter-domaines : index inversé des tokens (le top 1%
+    # le plus fréquent est exclu comme stopwords), on garde les paires partageant
+    # >=2 tokens avec des longueurs qui diffèrent de <30% ; l'expansion des
+    # paires tourne sur des tableaux typés, JIT-compilée si numba est présent
+    postings = {}
+    for i, t in enumerate(titles):
+        for tok in t.split():
+            postings.setdefault(tok, []).append(i)
+    if not postings:
+        return
+    sizes = np.array([len(p) for p in postings.values()], dtype=np.int64)
+    cut = np.quantile(sizes, 0.99)
+    lists = [p for p in postings.values() if len(p) <= cut]
+    n = len(titles)
+    flat = np.array([i for p in lists for i in p], dtype=np.int64)
+    offsets = np.zeros(len(lists)+1, dtype=np.int64)
+    np.cumsum([len(p) for p in lists], out=offsets[1:])
+    keys = _expand_pairs(flat, offsets, n)
+    if keys.size == 0:
+        return
+    uniq, cnt = np.unique(keys, return_counts=True)
+    uniq = uniq[cnt >= 2]
+    ii, jj = uniq // n, uniq % n
+    ok = np.abs(lengths[ii]-lengths[jj]) <= 0.3*np.maximum(lengths[ii], lengths[jj])
+    # les posting lists sont construites par index croissant, donc i<j toujours
+    yield from zip(ii[ok].tolist(), jj[ok].tolist())
+
 def dedupe(df, thresh=90):
     df = df.sort_values("date_pub", ascending=False).reset_index(drop=True)
-    keep = []
-    seen = [False]*len(df)
-    for i in tqdm(range(len(df)), desc="Dedup"):
-        if seen[i]: continue
-        keep.append(i)
-        ti = df.at[i, "titre"]
-        di = df.at[i, "domain"]
-        for j in range(i+1, len(df)):
-            if seen[j]: continue
-            dj = df.at[j, "domain"]
-            score = fuzz.token_set_ratio(ti, df.at[j, "titre"])
-            if (di and dj and di==dj and score>=thresh) or (score>=98):
-                seen[j] = True
-    return df.iloc[keep].copy()
-
-def extract_text(url, timeout=25):
-    try:
-        r = requests.get(url, timeout=timeout, headers={"User-Agent":"Mozilla/5.0"})
-        if r.status_code >= 400:
-            return None
-        downloaded = trafilatura.extract(r.text, url=url, include_comments=False, include_tables=False)
-        return downloaded
-    except Exception:
-        return None
+    # court-circuit même-URL : les doublons exacts (paramètres de tracking
+    # exclus) n'atteignent jamais la passe floue ; les lignes sans lien restent
+    dup_url = df["lien_canon"].duplicated() & (df["lien_canon"] != "")
+    df = df.loc[~dup_url.to_numpy()].reset_index(drop=True)
+    n = len(df)
+    if n < 2:
+        return df.copy()
+    # matérialisé une fois en ndarray : accès élément côté C et indexation
+    # avancée pour les buckets de domaine, aucun indexeur pandas dans la boucle
+    titles = np.array([_canon(t) for t in df["titre"].to_numpy(dtype=object)], dtype=object)
+    dropped = np.zeros(n, dtype=bool)
+    # passe intra-domaine : une matrice de similarité par domaine (noyau C, multi-threads)
+    for idx in tqdm(df.groupby("domain").indices.values(), desc="Dedup (domain)"):
+        if len(idx) < 2:
+            continue
+        bucket = titles[idx]
+        # Jaro-Winkler évite la matrice DP et exploite score_cutoff pour sortir
+        # tôt ; les scores sont entre 0 et 1, d'où le seuil rescalé
+        m = cdist(bucket, bucket, scorer=JaroWinkler.normalized_similarity, processor=None,
+                  score_cutoff=thresh/100, dtype=np.float32, workers=-1)
+        # lignes triées par date desc : la première occurrence i gagne, on retire j si i<j
+        dup = (np.triu(m, 1) >= thresh/100).any(axis=0)
+        dropped[idx[dup]] = True
+    # passe globale quasi-exacte à 98, limitée aux paires candidates du blocage
+    lengths = np.fromiter((len(t) for t in titles), dtype=np.int64, count=n)
+    for i, j in tqdm(_candidate_pairs(titles, lengths), desc="Dedup (global)"):
+        if dropped[j]:
+            continue
+        if fuzz.ratio(titles[i], titles[j], processor=None, score_cutoff=98) >= 98:
+            dropped[j] = True
+    return df.iloc[np.flatnonzero(~dropped)].copy()
+
+async def _fetch(session, url, sem, timeout=25):
+    async with sem:
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as r:
+            if r.status >= 400:
+                return None
+            return await r.text()
+
+async def _extract_all(urls, concurrency=32, extract_workers=8):
+    # téléchargements à concurrence bornée ; trafilatura tourne dans un pool de threads (CPU)
+    sem = asyncio.Semaphore(concurrency)
+    loop = asyncio.get_running_loop()
+    conn = aiohttp.TCPConnector(limit=64, limit_per_host=4)
+    texts = [None] * len(urls)
+
+    async def one(i, url):
+        try:
+            html = await _fetch(session, url, sem)
+        except Exception:
+            return
+        if html:
+            texts[i] = await loop.run_in_executor(
+                pool, lambda: trafilatura.extract(
+                    html, url=url, include_comments=False, include_tables=False))
+
+    with ThreadPoolExecutor(extract_workers) as pool:
+        async with aiohttp.ClientSession(connector=conn,
+                                         headers={"User-Agent": "Mozilla/5.0"}) as session:
+            tasks = [asyncio.ensure_future(one(i, u)) for i, u in enumerate(urls) if u]
+            for fut in tqdm(asyncio.as_completed(tasks), total=len(tasks), desc="Extract text"):
+                await fut
+    return texts
 
 def maybe_extract(df, do_extract=False):
     if not do_extract:
         return df
-    texts = []
-    for u in tqdm(df["lien"].fillna("").tolist(), desc="Extract text"):
-        if not u:
-            texts.append(None)
-            continue
-        texts.append(extract_text(u))
-    if "fulltext" not in df.columns:
-        df["fulltext"] = texts
-    else:
-        df["fulltext"] = texts
+    urls = df["lien"].fillna("").tolist()
+    df["fulltext"] = asyncio.run(_extract_all(urls))
     return df
 
 
@@ -282,9 +502,10 @@ def run_harvest(since_str: str, until_str: str, config_path: str, out_dir: str)
     until = dtp.parse(until_str)
     rate = conf.get("rate_limit",{}).get("sleep_seconds", 1.0)
 
+    rss_workers = conf.get("rss_workers", 8)
     total = 0
-    total += harvest_rss(conf["sources"].get("rss",[]), since, until, rate, out_dir, label="news")
-    total += harvest_rss(conf["sources"].get("ngo_rss",[]), since, until, rate, out_dir, label="ngo")
+    total += harvest_rss(conf["sources"].get("rss",[]), since, until, rate, out_dir, label="news", workers=rss_workers)
+    total += harvest_rss(conf["sources"].get("ngo_rss",[]), since, until, rate, out_dir, label="ngo", workers=rss_workers)
     total += harvest_openalex(conf["sources"].get("openalex",{}), since, until, rate, out_dir)
     total += harvest_gdelt(conf["sources"].get("gdelt",{}), since, until, rate, out_dir)
     print(f"Harvested rows: {total}")
@@ -304,7 +525,12 @@ def run_clean(raw_dir: str, out_path: str, extract_text: bool) -> int:
     cols = SCHEMA + (["fulltext"] if "fulltext" in df.columns else [])
     df = df[cols]
     os.makedirs(os.path.dirname(out_path), exist_ok=True)
-    df.to_csv(out_path, index=False)
+    # le Parquet est le corpus canonique ; le CSV passe par l'écrivain C++
+    # multithread d'Arrow plutôt que le to_csv ligne à ligne de pandas
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pacsv.write_csv(table, out_path,
+                    write_options=pacsv.WriteOptions(include_header=True))
+    df.to_parquet(os.path.splitext(out_path)[0] + ".parquet", compression="zstd")
     print(f"Wrote {out_path} with {len(df)} rows.")
     return len(df)
 